@@ -2,10 +2,13 @@
 Database monitoring and performance tracking.
 """
 
+import heapq
 import logging
+import re
 import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List
+from typing import Deque, Dict, List, Tuple
 
 from prometheus_client import REGISTRY, Counter, Gauge, Histogram
 from sqlalchemy import event
@@ -75,6 +78,35 @@ _init_metrics()
 # Configuration
 SLOW_QUERY_THRESHOLD = 0.1  # 100ms
 MAX_SLOW_QUERIES_LOG = 1000  # Maximum slow queries to keep in memory
+PERCENTILE_MIN_SAMPLES = 20  # Below this, p95/p99 are reported as None
+
+
+_PARSED_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+# 첫 번째 FROM 토큰 뒤의 단어 / 두 번째 단어
+_FROM_TABLE_PATTERN = re.compile(r"(?:^|\s)FROM\s+(\S+)", re.IGNORECASE)
+_SECOND_WORD_PATTERN = re.compile(r"\S+\s+(\S+)")
+
+
+def _weighted_percentiles(
+    samples: List[Tuple[float, int]], total: int, fractions: Tuple[float, ...]
+) -> List[float]:
+    """
+    (값, 개수) 쌍에서 여러 백분위 값을 한 번의 정렬로 계산
+
+    각 값을 개수만큼 펼친 정렬 목록의 int(total * fraction) 번째 원소와 같은
+    결과를 펼치지 않고 구합니다. fractions는 오름차순이어야 합니다.
+    """
+    samples = sorted(samples)
+    results = []
+    cumulative = 0
+    i = 0
+    for fraction in fractions:
+        index = int(total * fraction)
+        while cumulative + samples[i][1] <= index:
+            cumulative += samples[i][1]
+            i += 1
+        results.append(samples[i][0])
+    return results
 
 
 class DatabaseMonitor:
@@ -82,8 +114,13 @@ class DatabaseMonitor:
 
     def __init__(self):
         """Initialize database monitor."""
-        self.slow_queries: List[Dict] = []
+        # 최근 느린 쿼리만 유지하는 고정 크기 링 버퍼
+        self.slow_queries: Deque[Dict] = deque(maxlen=MAX_SLOW_QUERIES_LOG)
         self.query_stats: Dict[str, Dict] = {}
+        # 전체 합계는 기록 시 누적해 조회 때 query_stats를 다시 훑지 않음
+        self.total_queries = 0
+        self.total_errors = 0
+        self.total_duration = 0.0
         self.start_time = datetime.utcnow()
 
     def setup_monitoring(self, engine: Engine):
@@ -104,7 +141,7 @@ class DatabaseMonitor:
         self, conn, cursor, statement, parameters, context, executemany
     ):
         """Before cursor execute event."""
-        context._query_start_time = time.time()
+        context._query_start_time = time.perf_counter()
         context._query_statement = statement
 
     def _after_cursor_execute(
@@ -112,13 +149,13 @@ class DatabaseMonitor:
     ):
         """After cursor execute event."""
         if hasattr(context, "_query_start_time"):
-            duration = time.time() - context._query_start_time
+            duration = time.perf_counter() - context._query_start_time
             self._record_query(statement, duration, "success")
 
     def _handle_error(self, conn, cursor, statement, parameters, context, exception):
         """Handle query error."""
         if hasattr(context, "_query_start_time"):
-            duration = time.time() - context._query_start_time
+            duration = time.perf_counter() - context._query_start_time
             self._record_query(statement, duration, "error")
 
     def _record_query(self, statement: str, duration: float, status: str):
@@ -141,44 +178,27 @@ class DatabaseMonitor:
 
     def _parse_statement(self, statement: str) -> tuple[str, str]:
         """Parse SQL statement to extract operation and table."""
-        statement = statement.strip().upper()
-
-        # Determine operation
-        if statement.startswith("SELECT"):
-            operation = "SELECT"
-        elif statement.startswith("INSERT"):
-            operation = "INSERT"
-        elif statement.startswith("UPDATE"):
-            operation = "UPDATE"
-        elif statement.startswith("DELETE"):
-            operation = "DELETE"
-        else:
+        statement = statement.strip()
+
+        # Determine operation (only the leading keyword is upper-cased)
+        operation = statement[:6].upper()
+        if operation not in _PARSED_OPERATIONS:
             operation = "OTHER"
 
-        # Try to extract table name
+        # Try to extract table name without splitting the whole statement
         table = "unknown"
-        words = statement.split()
 
-        if operation == "SELECT":
+        if operation in ("SELECT", "DELETE"):
             # Look for FROM clause
-            try:
-                from_index = words.index("FROM")
-                if from_index + 1 < len(words):
-                    table = words[from_index + 1]
-            except ValueError:
-                pass
-        elif operation in ["INSERT", "UPDATE"]:
+            match = _FROM_TABLE_PATTERN.search(statement)
+        elif operation in ("INSERT", "UPDATE"):
             # Table name is usually after INSERT/UPDATE
-            if len(words) > 1:
-                table = words[1]
-        elif operation == "DELETE":
-            # Look for FROM clause in DELETE
-            try:
-                from_index = words.index("FROM")
-                if from_index + 1 < len(words):
-                    table = words[from_index + 1]
-            except ValueError:
-                pass
+            match = _SECOND_WORD_PATTERN.match(statement)
+        else:
+            match = None
+
+        if match:
+            table = match.group(1).upper()
 
         return operation, table
 
@@ -187,81 +207,84 @@ class DatabaseMonitor:
     ):
         """Log slow query details."""
         slow_query = {
-            "timestamp": datetime.utcnow(),
+            "timestamp": time.time(),
             "duration": duration,
             "operation": operation,
             "table": table,
             "statement": statement[:200] + "..." if len(statement) > 200 else statement,
         }
 
+        # deque(maxlen)이 가장 오래된 항목을 자동으로 제거
         self.slow_queries.append(slow_query)
 
-        # Keep only recent slow queries
-        if len(self.slow_queries) > MAX_SLOW_QUERIES_LOG:
-            self.slow_queries = self.slow_queries[-MAX_SLOW_QUERIES_LOG:]
-
         logger.warning(f"Slow query detected: {duration:.3f}s - {operation} on {table}")
 
     def _update_stats(self, operation: str, table: str, duration: float, status: str):
         """Update internal query statistics."""
         key = f"{operation}_{table}"
 
-        if key not in self.query_stats:
-            self.query_stats[key] = {
+        # 조회와 삽입을 한 번의 딕셔너리 탐색으로 처리
+        stats = self.query_stats.get(key)
+        if stats is None:
+            stats = self.query_stats[key] = {
                 "count": 0,
                 "total_duration": 0.0,
                 "avg_duration": 0.0,
-                "min_duration": float("inf"),
-                "max_duration": 0.0,
+                "min_duration": duration,
+                "max_duration": duration,
                 "errors": 0,
             }
+        elif duration < stats["min_duration"]:
+            stats["min_duration"] = duration
+        elif duration > stats["max_duration"]:
+            stats["max_duration"] = duration
 
-        stats = self.query_stats[key]
-        stats["count"] += 1
+        count = stats["count"] + 1
+        stats["count"] = count
         stats["total_duration"] += duration
-        stats["avg_duration"] = stats["total_duration"] / stats["count"]
-        stats["min_duration"] = min(stats["min_duration"], duration)
-        stats["max_duration"] = max(stats["max_duration"], duration)
+        stats["avg_duration"] = stats["total_duration"] / count
+        self.total_queries += 1
+        self.total_duration += duration
 
         if status == "error":
             stats["errors"] += 1
+            self.total_errors += 1
 
     def get_slow_queries(self, limit: int = 10) -> List[Dict]:
         """Get recent slow queries."""
-        return sorted(self.slow_queries, key=lambda x: x["duration"], reverse=True)[
-            :limit
-        ]
+        # 전체 정렬 대신 상위 limit개만 선택
+        return heapq.nlargest(limit, self.slow_queries, key=lambda x: x["duration"])
 
     def get_query_stats(self) -> Dict:
         """Get query statistics."""
         return {
             "start_time": self.start_time,
             "uptime": datetime.utcnow() - self.start_time,
-            "total_queries": sum(stats["count"] for stats in self.query_stats.values()),
+            "total_queries": self.total_queries,
             "slow_queries_count": len(self.slow_queries),
             "query_stats": self.query_stats,
         }
 
     def get_performance_summary(self) -> Dict:
         """Get performance summary."""
-        if not self.query_stats:
-            return {"message": "No queries recorded yet"}
-
-        all_durations = []
-        total_queries = 0
-        total_errors = 0
-
-        for stats in self.query_stats.values():
-            all_durations.extend([stats["avg_duration"]] * stats["count"])
-            total_queries += stats["count"]
-            total_errors += stats["errors"]
-
-        if all_durations:
-            avg_duration = sum(all_durations) / len(all_durations)
-            p95_duration = sorted(all_durations)[int(len(all_durations) * 0.95)]
-            p99_duration = sorted(all_durations)[int(len(all_durations) * 0.99)]
-        else:
-            avg_duration = p95_duration = p99_duration = 0.0
+        total_queries = self.total_queries
+        total_errors = self.total_errors
+
+        avg_duration = self.total_duration / total_queries if total_queries else 0.0
+
+        # 표본이 적으면 백분위 값이 의미가 없으므로 계산하지 않음
+        p95_ms = p99_ms = None
+        if total_queries >= PERCENTILE_MIN_SAMPLES:
+            p95_duration, p99_duration = _weighted_percentiles(
+                [
+                    (stats["avg_duration"], stats["count"])
+                    for stats in self.query_stats.values()
+                ],
+                total_queries,
+                (0.95, 0.99),
+            )
+            p95_ms = p95_duration * 1000
+            p99_ms = p99_duration * 1000
 
         return {
             "total_queries": total_queries,
@@ -270,8 +293,8 @@ class DatabaseMonitor:
                 (total_errors / total_queries * 100) if total_queries > 0 else 0
             ),
             "avg_duration_ms": avg_duration * 1000,
-            "p95_duration_ms": p95_duration * 1000,
-            "p99_duration_ms": p99_duration * 1000,
+            "p95_duration_ms": p95_ms,
+            "p99_duration_ms": p99_ms,
             "slow_queries_count": len(self.slow_queries),
             "uptime_seconds": (datetime.utcnow() - self.start_time).total_seconds(),
         }
@@ -9,8 +9,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.utils.logging_config import get_logger
+from app.utils.logging_config import get_logger, stop_queue_listeners
 from app.routers import files, download, system
+from app.utils.file_utils import get_hash_backend_info
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -111,6 +112,16 @@ async def startup_event():
     upload_dir.mkdir(parents=True, exist_ok=True)
     
     logger.info(f"Upload directory: {upload_dir}")
+
+    # 해시 백엔드 확인 (SHA CPU 확장이 없으면 해시 계산이 느려질 수 있음)
+    hash_backend = get_hash_backend_info()
+    logger.info(
+        f"Hash backend: {hash_backend['openssl_version']}, "
+        f"SHA CPU extensions: {hash_backend['sha_extensions']}"
+    )
+    if hash_backend["sha_extensions"] is False:
+        logger.warning("CPU SHA extensions not available; SHA-256 runs in software")
+
     logger.info("FileWallBall API started successfully")
 
 
@@ -119,6 +130,9 @@ async def shutdown_event():
     """Application shutdown."""
     logger.info("FileWallBall API shutting down...")
 
+    # 파일 로그 리스너에 남은 레코드 기록
+    stop_queue_listeners()
+
 
 if __name__ == "__main__":
     import uvicorn
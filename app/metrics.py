@@ -47,12 +47,12 @@ class MockTimer:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.start_time:
-            duration = time.time() - self.start_time
+            duration = time.perf_counter() - self.start_time
             self.histogram.observe(duration)
 
 
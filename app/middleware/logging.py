@@ -2,17 +2,20 @@
 Request/Response logging middleware.
 """
 
-import json
 from typing import Any, Callable, Dict
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from app.utils.json_utils import dumps
 from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 로그에 남기지 않을 요청 헤더 (소문자)
+SENSITIVE_HEADERS = ("authorization", "cookie", "x-api-key")
+
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """요청/응답 로깅 미들웨어"""
@@ -24,24 +27,23 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         """요청/응답 로깅"""
 
         # 요청 정보 로깅
-        await self._log_request(request)
+        self._log_request(request)
 
         # 응답 처리
         response = await call_next(request)
 
         # 응답 정보 로깅
-        await self._log_response(request, response)
+        self._log_response(request, response)
 
         return response
 
-    async def _log_request(self, request: Request) -> None:
-        """요청 정보 로깅"""
+    def _log_request(self, request: Request) -> None:
+        """요청 정보 로깅 (I/O가 없으므로 코루틴으로 만들지 않음)"""
         request_id = getattr(request.state, "request_id", "unknown")
 
         # 요청 헤더에서 민감한 정보 제거
         headers = dict(request.headers)
-        sensitive_headers = ["authorization", "cookie", "x-api-key"]
-        for header in sensitive_headers:
+        for header in SENSITIVE_HEADERS:
             if header in headers:
                 headers[header] = "[REDACTED]"
 
@@ -54,10 +56,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             "user_agent": request.headers.get("user-agent"),
         }
 
-        logger.info(f"Request: {json.dumps(log_data, default=str)}")
+        logger.info(f"Request: {dumps(log_data)}")
 
-    async def _log_response(self, request: Request, response: Response) -> None:
-        """응답 정보 로깅"""
+    def _log_response(self, request: Request, response: Response) -> None:
+        """응답 정보 로깅 (I/O가 없으므로 코루틴으로 만들지 않음)"""
         request_id = getattr(request.state, "request_id", "unknown")
 
         log_data = {
@@ -68,4 +70,4 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             "response_headers": dict(response.headers),
         }
 
-        logger.info(f"Response: {json.dumps(log_data, default=str)}")
+        logger.info(f"Response: {dumps(log_data)}")
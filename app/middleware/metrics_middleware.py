@@ -3,6 +3,7 @@ Prometheus 메트릭 수집 미들웨어
 Task 9: Prometheus 메트릭 및 모니터링 시스템
 """
 
+import re
 import time
 from typing import Callable
 
@@ -19,6 +20,12 @@ from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 엔드포인트 정규화 패턴 (요청마다 패턴 캐시를 조회하지 않도록 미리 컴파일)
+UUID_PATH_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+NUMERIC_ID_PATTERN = re.compile(r"/\d+")
+
 
 class MetricsMiddleware(BaseHTTPMiddleware):
     """HTTP 요청 메트릭 수집 미들웨어"""
@@ -30,14 +37,14 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         self, request: Request, call_next: Callable
     ) -> StarletteResponse:
         """요청/응답 처리 및 메트릭 수집"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # 요청 처리
             response = await call_next(request)
 
             # 응답 시간 계산
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # 메트릭 수집
             self._record_metrics(request, response, duration, None)
@@ -46,7 +53,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
 
         except Exception as e:
             # 에러 발생 시 메트릭 수집
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self._record_metrics(request, None, duration, e)
             raise
 
@@ -64,29 +71,30 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             path = request.url.path
             status_code = response.status_code if response else 500
 
-            # 라벨 설정
-            labels = {
-                "method": method,
-                "endpoint": self._normalize_endpoint(path),
-                "status": str(status_code),
-                "status_class": self._get_status_class(status_code),
-            }
+            # 라벨 값은 요청당 한 번만 계산해 모든 메트릭에서 재사용
+            endpoint = self._normalize_endpoint(path)
+            status_class = self._get_status_class(status_code)
 
             # HTTP 요청 카운터 증가
-            http_requests_total.labels(**labels).inc()
+            http_requests_total.labels(
+                method=method,
+                endpoint=endpoint,
+                status=str(status_code),
+                status_class=status_class,
+            ).inc()
 
             # 요청 지속 시간 기록
             http_request_duration_seconds.labels(
                 method=method,
-                endpoint=self._normalize_endpoint(path),
-                status_class=self._get_status_class(status_code),
+                endpoint=endpoint,
+                status_class=status_class,
             ).observe(duration)
 
             # 에러 발생 시 에러 카운터 증가
             if error or (response and status_code >= 400):
                 error_type = type(error).__name__ if error else f"http_{status_code}"
                 error_rate_counter.labels(
-                    error_type=error_type, endpoint=self._normalize_endpoint(path)
+                    error_type=error_type, endpoint=endpoint
                 ).inc()
 
         except Exception as e:
@@ -95,16 +103,10 @@ class MetricsMiddleware(BaseHTTPMiddleware):
     def _normalize_endpoint(self, path: str) -> str:
         """엔드포인트 정규화 (동적 경로를 패턴으로 변환)"""
         # UUID 패턴을 {id}로 변환
-        import re
-
-        normalized = re.sub(
-            r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-            "{id}",
-            path,
-        )
+        normalized = UUID_PATH_PATTERN.sub("{id}", path)
 
         # 숫자 ID를 {id}로 변환
-        normalized = re.sub(r"/\d+", "/{id}", normalized)
+        normalized = NUMERIC_ID_PATTERN.sub("/{id}", normalized)
 
         return normalized
 
@@ -204,7 +206,7 @@ def track_metrics(operation: str, metric_type: str = "counter"):
 
     def decorator(func: Callable):
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
                 result = await func(*args, **kwargs)
@@ -213,7 +215,7 @@ def track_metrics(operation: str, metric_type: str = "counter"):
                 if metric_type == "counter":
                     record_file_upload_metric("success", operation)
                 elif metric_type == "histogram":
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     record_upload_duration_metric(operation, "success", duration)
 
                 return result
@@ -223,7 +225,7 @@ def track_metrics(operation: str, metric_type: str = "counter"):
                 if metric_type == "counter":
                     record_file_upload_metric("error", operation)
                 elif metric_type == "histogram":
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     record_upload_duration_metric(operation, "error", duration)
 
                 record_upload_error_metric(type(e).__name__, operation)
@@ -23,14 +23,14 @@ class ResponseTimeMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """요청 처리 및 응답 시간 측정"""
 
-        # 시작 시간 기록
-        start_time = time.time()
+        # 시작 시각 기록 (벽시계 보정에 영향받지 않는 단조 시계)
+        start_time = time.perf_counter()
 
         # 응답 처리
         response = await call_next(request)
 
         # 응답 시간 계산
-        response_time = time.time() - start_time
+        response_time = time.perf_counter() - start_time
 
         # 응답 헤더에 응답 시간 추가
         response.headers["X-Response-Time"] = f"{response_time:.4f}s"
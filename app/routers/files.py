@@ -7,6 +7,7 @@ information retrieval, and deletion operations.
 
 import os
 import mimetypes
+import re
 from pathlib import Path
 from typing import List, Optional
 import uuid
@@ -23,6 +24,7 @@ from app.config import get_settings
 from app.models.orm_models import FileInfo
 from app.services.file_storage_service import FileStorageService
 from app.services.file_validation_service import FileValidationService
+from app.utils.file_utils import calculate_content_hash_async
 from app.utils.logging_config import get_logger
 
 # Initialize router
@@ -99,14 +101,15 @@ class FileInfoResponse(BaseModel):
         }
 
 
+# MIME type format: type/subtype
+# type and subtype should contain only alphanumeric characters, hyphens, and dots
+MIME_TYPE_PATTERN = re.compile(r'^[a-zA-Z0-9\-\.]+\/[a-zA-Z0-9\-\.]+$')
+
+
 # MIME type validation function
 def _is_valid_mime_type(mime_type: str) -> bool:
     """Validate MIME type format."""
-    import re
-    # MIME type format: type/subtype
-    # type and subtype should contain only alphanumeric characters, hyphens, and dots
-    pattern = r'^[a-zA-Z0-9\-\.]+\/[a-zA-Z0-9\-\.]+$'
-    return bool(re.match(pattern, mime_type))
+    return bool(MIME_TYPE_PATTERN.match(mime_type))
 
 
 @router.post(
@@ -281,8 +284,8 @@ async def upload_file(
         # Log MIME type detection result
         logger.info(f"Final MIME type for {file_id}: {mime_type} (original: {file.content_type})")
         
-        # Calculate file hash (simple implementation)
-        file_hash = str(hash(content))[:16]
+        # Calculate file hash (SHA-256, computed off the event loop for large files)
+        file_hash = await calculate_content_hash_async(content, "sha256")
         
         # Create file info record
         file_info = FileInfo(
@@ -0,0 +1,69 @@
+"""
+감사 로그 서비스
+
+현재 감사 이벤트를 기록하는 곳은 file_deletion_service뿐입니다. 이 서비스는
+아직 어떤 라우터에도 연결되어 있지 않으므로 이벤트를 DB에 저장하지 않고
+로그로만 남깁니다.
+"""
+
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from app.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class AuditAction(str, Enum):
+    """감사 대상 액션"""
+
+    CREATE = "create"
+    READ = "read"
+    UPDATE = "update"
+    DELETE = "delete"
+    UPLOAD = "upload"
+    DOWNLOAD = "download"
+    LOGIN = "login"
+    LOGOUT = "logout"
+
+
+class AuditResult(str, Enum):
+    """감사 이벤트 결과"""
+
+    SUCCESS = "success"
+    FAILED = "failed"
+    DENIED = "denied"
+
+
+class AuditLogService:
+    """감사 로그 서비스"""
+
+    def log_audit_event(
+        self,
+        action: AuditAction,
+        resource_type: str,
+        resource_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        user_ip: Optional[str] = None,
+        result: AuditResult = AuditResult.SUCCESS,
+        error_message: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """감사 이벤트 로그 기록"""
+        message = (
+            f"Audit: {AuditAction(action).value} {resource_type}/{resource_id} "
+            f"{AuditResult(result).value} user={user_id} ip={user_ip or 'unknown'}"
+        )
+        if error_message:
+            message += f" error={error_message}"
+        if details:
+            message += f" details={details}"
+
+        if result == AuditResult.SUCCESS:
+            logger.info(message)
+        else:
+            logger.warning(message)
+
+
+# 전역 인스턴스
+audit_log_service = AuditLogService()
@@ -2,34 +2,61 @@
 Cache service - 단순화된 버전
 """
 
-from typing import Any, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 메모리 캐시 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+CACHE_MAX_ENTRIES = 10000
+
+_MISSING = object()
+
 
 class CacheService:
     """캐시 서비스 (단순화된 버전)"""
-    
-    def __init__(self):
-        self.cache = {}  # 메모리 기반 단순 캐시
-    
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        # 메모리 기반 LRU 캐시: 키 -> (만료 시각, 값)
+        self.cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.max_entries = max_entries
+
+    def _lookup(self, key: str) -> Any:
+        """만료되지 않은 값을 반환하고 최근 사용으로 표시 (없으면 _MISSING)"""
+        entry = self.cache.get(key)
+        if entry is None:
+            return _MISSING
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self.cache[key]
+            return _MISSING
+
+        self.cache.move_to_end(key)
+        return value
+
     async def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 조회"""
-        return self.cache.get(key)
-    
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
     async def set(self, key: str, value: Any, expire: int = 3600) -> bool:
-        """캐시에 값 저장"""
-        self.cache[key] = value
+        """캐시에 값 저장 (expire초 후 만료)"""
+        self.cache[key] = (time.monotonic() + expire, value)
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
         return True
-    
+
     async def delete(self, key: str) -> bool:
         """캐시에서 값 삭제"""
         if key in self.cache:
             del self.cache[key]
             return True
         return False
-    
+
     async def clear(self) -> bool:
         """캐시 전체 삭제"""
         self.cache.clear()
@@ -37,4 +64,4 @@ class CacheService:
 
 
 # 싱글톤 인스턴스
-cache_service = CacheService()
\ No newline at end of file
+cache_service = CacheService()
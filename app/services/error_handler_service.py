@@ -3,6 +3,7 @@
 """
 
 import asyncio
+import logging
 import os
 import shutil
 from datetime import datetime
@@ -16,7 +17,14 @@ from sqlalchemy.exc import DisconnectionError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from app.models.orm_models import FileInfo, FileUpload
-from app.utils.security_utils import generate_uuid
+from app.utils.logging_config import add_queued_handler, get_logger
+from app.utils.security_utils import generate_uuid, get_client_ip
+
+logger = get_logger(__name__)
+
+
+# 오래된 에러 기록 정리 시 한 번에 삭제할 행 수
+CLEANUP_BATCH_SIZE = 500
 
 
 class ErrorType(Enum):
@@ -31,6 +39,36 @@ class ErrorType(Enum):
     UNKNOWN_ERROR = "unknown_error"
 
 
+# 에러 타입별 (상태 코드, 에러 메시지) 응답 테이블
+ERROR_RESPONSES = {
+    ErrorType.VALIDATION_ERROR: (
+        400,
+        "파일 검증에 실패했습니다. 파일 형식과 크기를 확인해주세요.",
+    ),
+    ErrorType.STORAGE_ERROR: (
+        500,
+        "파일 저장 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+    ),
+    ErrorType.DATABASE_ERROR: (
+        500,
+        "데이터베이스 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+    ),
+    ErrorType.NETWORK_ERROR: (
+        503,
+        "네트워크 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+    ),
+    ErrorType.PERMISSION_ERROR: (500, "파일 시스템 권한 오류가 발생했습니다."),
+    ErrorType.DISK_FULL_ERROR: (
+        507,
+        "저장소 용량이 부족합니다. 관리자에게 문의해주세요.",
+    ),
+}
+DEFAULT_ERROR_RESPONSE = (
+    500,
+    "알 수 없는 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+)
+
+
 class RetryableError(Enum):
     """재시도 가능한 에러"""
 
@@ -39,6 +77,19 @@ class RetryableError(Enum):
     STORAGE_TEMPORARY_ERROR = "storage_temporary_error"
 
 
+# 통계 집계 시 행마다 다시 만들지 않도록 미리 계산한 재시도 가능 에러 값
+RETRYABLE_ERROR_VALUES = frozenset(e.value for e in RetryableError)
+
+# 자동 재시도 대상 에러 타입
+RETRYABLE_ERROR_TYPES = frozenset(
+    {
+        ErrorType.NETWORK_ERROR,
+        ErrorType.DATABASE_ERROR,  # 연결 오류의 경우
+        ErrorType.STORAGE_ERROR,  # 임시 오류의 경우
+    }
+)
+
+
 class ErrorHandlerService:
     """업로드 에러 처리 및 복구 서비스"""
 
@@ -47,6 +98,11 @@ class ErrorHandlerService:
         self.base_storage_path = Path(base_storage_path)
         self.temp_dir = self.base_storage_path / "temp"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        # 에러 로그 경로는 인스턴스당 한 번만 확정 (에러마다 resolve()하지 않음)
+        self.error_log_file = (
+            self.base_storage_path / "logs" / "upload_errors.log"
+        ).resolve()
+        self._error_logger = logging.getLogger(f"upload_errors:{self.error_log_file}")
 
     async def handle_upload_error(
         self,
@@ -102,7 +158,7 @@ class ErrorHandlerService:
 
         except Exception as e:
             # 에러 처리 중 발생한 예외
-            print(f"에러 처리 중 추가 예외 발생: {e}")
+            logger.error(f"에러 처리 중 추가 예외 발생: {e}")
             return {
                 "error_type": ErrorType.UNKNOWN_ERROR.value,
                 "error_message": "내부 서버 오류가 발생했습니다.",
@@ -197,7 +253,7 @@ class ErrorHandlerService:
                 self.db_session.commit()
             else:
                 # 파일 정보가 없는 경우 로그만 기록
-                print(f"파일 정보를 찾을 수 없음: {file_uuid}")
+                logger.warning(f"파일 정보를 찾을 수 없음: {file_uuid}")
                 return {"error_id": generate_uuid()}
 
             # 에러 상세 정보 로깅
@@ -219,34 +275,52 @@ class ErrorHandlerService:
             return error_info
 
         except Exception as e:
-            print(f"에러 로그 기록 실패: {e}")
+            logger.error(f"에러 로그 기록 실패: {e}")
             return {"error_id": generate_uuid()}
 
     async def _write_error_log(self, error_info: Dict[str, Any]) -> None:
         """
         에러 로그 파일에 기록
 
+        에러마다 파일을 열고 쓰지 않고 전용 로거의 큐에 넣으면, 열린 파일
+        핸들을 유지하는 리스너 스레드가 이어서 기록합니다 (write-behind).
+
         Args:
             error_info: 에러 정보
         """
         try:
-            log_file = self.base_storage_path / "logs" / "upload_errors.log"
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-
             log_entry = (
                 f"[{error_info['timestamp']}] "
                 f"ERROR_ID={error_info['error_id']} "
                 f"FILE_UUID={error_info['file_uuid']} "
                 f"TYPE={error_info['error_type']} "
                 f"IP={error_info['upload_ip']} "
-                f"MESSAGE={error_info['error_message']}\n"
+                f"MESSAGE={error_info['error_message']}"
             )
 
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(log_entry)
+            self._get_error_log_writer().info(log_entry)
 
         except Exception as e:
-            print(f"에러 로그 파일 기록 실패: {e}")
+            logger.error(f"에러 로그 파일 기록 실패: {e}")
+
+    def _get_error_log_writer(self) -> logging.Logger:
+        """
+        upload_errors.log 기록용 로거 (파일 쓰기는 리스너 스레드에서 수행)
+
+        같은 경로를 쓰는 인스턴스는 로거와 리스너 스레드 하나를 공유하며,
+        리스너는 종료 시 stop_queue_listeners()가 남은 기록을 쓰고 정리합니다.
+        """
+        error_logger = self._error_logger
+
+        if not error_logger.handlers:
+            self.error_log_file.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.FileHandler(self.error_log_file, encoding="utf-8")
+            file_handler.setFormatter(logging.Formatter("%(message)s"))
+            add_queued_handler(error_logger, file_handler)
+            error_logger.setLevel(logging.INFO)
+            error_logger.propagate = False
+
+        return error_logger
 
     async def _cleanup_temp_files(self, file_uuid: str) -> None:
         """
@@ -260,7 +334,7 @@ class ErrorHandlerService:
             for temp_file in self.temp_dir.glob(f"*{file_uuid}*"):
                 if temp_file.is_file():
                     temp_file.unlink()
-                    print(f"임시 파일 삭제: {temp_file}")
+                    logger.info(f"임시 파일 삭제: {temp_file}")
 
             # 저장 디렉토리에서 부분적으로 저장된 파일 삭제
             uuid_prefix = file_uuid[:2]
@@ -271,14 +345,14 @@ class ErrorHandlerService:
                 for file_path in storage_dir.glob(f"{file_uuid}*"):
                     if file_path.is_file():
                         file_path.unlink()
-                        print(f"부분 저장 파일 삭제: {file_path}")
+                        logger.info(f"부분 저장 파일 삭제: {file_path}")
 
                 # 빈 디렉토리 삭제
                 if not any(storage_dir.iterdir()):
                     storage_dir.rmdir()
 
         except Exception as e:
-            print(f"임시 파일 정리 실패: {e}")
+            logger.error(f"임시 파일 정리 실패: {e}")
 
     async def _rollback_database_changes(self, file_uuid: str) -> None:
         """
@@ -297,14 +371,14 @@ class ErrorHandlerService:
 
             if file_info:
                 self.db_session.delete(file_info)
-                print(f"파일 정보 롤백: {file_uuid}")
+                logger.info(f"파일 정보 롤백: {file_uuid}")
 
             # 트랜잭션 커밋
             self.db_session.commit()
 
         except Exception as e:
             self.db_session.rollback()
-            print(f"데이터베이스 롤백 실패: {e}")
+            logger.error(f"데이터베이스 롤백 실패: {e}")
 
     def _is_retryable_error(self, error_type: ErrorType) -> bool:
         """
@@ -316,13 +390,7 @@ class ErrorHandlerService:
         Returns:
             재시도 가능 여부
         """
-        retryable_types = [
-            ErrorType.NETWORK_ERROR,
-            ErrorType.DATABASE_ERROR,  # 연결 오류의 경우
-            ErrorType.STORAGE_ERROR,  # 임시 오류의 경우
-        ]
-
-        return error_type in retryable_types
+        return error_type in RETRYABLE_ERROR_TYPES
 
     def _generate_error_response(
         self, error_type: ErrorType, error: Exception
@@ -337,26 +405,7 @@ class ErrorHandlerService:
         Returns:
             (상태 코드, 에러 메시지) 튜플
         """
-        if error_type == ErrorType.VALIDATION_ERROR:
-            return 400, "파일 검증에 실패했습니다. 파일 형식과 크기를 확인해주세요."
-
-        elif error_type == ErrorType.STORAGE_ERROR:
-            return 500, "파일 저장 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
-
-        elif error_type == ErrorType.DATABASE_ERROR:
-            return 500, "데이터베이스 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
-
-        elif error_type == ErrorType.NETWORK_ERROR:
-            return 503, "네트워크 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
-
-        elif error_type == ErrorType.PERMISSION_ERROR:
-            return 500, "파일 시스템 권한 오류가 발생했습니다."
-
-        elif error_type == ErrorType.DISK_FULL_ERROR:
-            return 507, "저장소 용량이 부족합니다. 관리자에게 문의해주세요."
-
-        else:
-            return 500, "알 수 없는 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+        return ERROR_RESPONSES.get(error_type, DEFAULT_ERROR_RESPONSE)
 
     def _get_client_ip(self, request: Request) -> str:
         """
@@ -368,15 +417,7 @@ class ErrorHandlerService:
         Returns:
             클라이언트 IP 주소
         """
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-
-        return request.client.host if request.client else "unknown"
+        return get_client_ip(request)
 
     async def get_error_statistics(self, days: int = 30) -> Dict[str, Any]:
         """
@@ -418,7 +459,7 @@ class ErrorHandlerService:
             retryable_errors = sum(
                 count
                 for error_type, count in error_types
-                if error_type in [e.value for e in RetryableError]
+                if error_type in RETRYABLE_ERROR_VALUES
             )
 
             return {
@@ -430,7 +471,7 @@ class ErrorHandlerService:
             }
 
         except Exception as e:
-            print(f"에러 통계 조회 실패: {e}")
+            logger.error(f"에러 통계 조회 실패: {e}")
             return {}
 
     async def cleanup_old_error_logs(self, days: int = 90) -> int:
@@ -449,25 +490,35 @@ class ErrorHandlerService:
             cutoff_date = datetime.now() - timedelta(days=days)
             deleted_count = 0
 
-            # 오래된 업로드 실패 기록 삭제
-            old_records = (
-                self.db_session.query(FileUpload)
-                .filter(
-                    FileUpload.upload_time < cutoff_date,
-                    FileUpload.upload_status == "failed",
+            # 오래된 업로드 실패 기록을 행 단위 로드/삭제 대신 ID 배치 단위
+            # 일괄 DELETE로 삭제 (긴 잠금을 피하기 위해 배치마다 커밋)
+            while True:
+                record_ids = [
+                    record_id
+                    for (record_id,) in self.db_session.query(FileUpload.id)
+                    .filter(
+                        FileUpload.upload_started_at < cutoff_date,
+                        FileUpload.upload_status == "failed",
+                    )
+                    .limit(CLEANUP_BATCH_SIZE)
+                    .all()
+                ]
+                if not record_ids:
+                    break
+
+                deleted_count += (
+                    self.db_session.query(FileUpload)
+                    .filter(FileUpload.id.in_(record_ids))
+                    .delete(synchronize_session=False)
                 )
-                .all()
-            )
-
-            for record in old_records:
-                self.db_session.delete(record)
-                deleted_count += 1
+                self.db_session.commit()
 
-            self.db_session.commit()
+                if len(record_ids) < CLEANUP_BATCH_SIZE:
+                    break
 
             return deleted_count
 
         except Exception as e:
             self.db_session.rollback()
-            print(f"오래된 에러 로그 정리 실패: {e}")
+            logger.error(f"오래된 에러 로그 정리 실패: {e}")
             return 0
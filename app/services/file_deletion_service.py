@@ -84,7 +84,7 @@ class FileDeletionService:
                 raise ValueError(f"지원하지 않는 삭제 타입입니다: {deletion_type}")
 
             # 감사 로그 기록
-            await audit_log_service.log_audit_event(
+            audit_log_service.log_audit_event(
                 action=AuditAction.DELETE,
                 resource_type="file",
                 resource_id=file_id,
@@ -106,7 +106,7 @@ class FileDeletionService:
             logger.error(f"파일 삭제 실패: {e}")
 
             # 감사 로그 기록
-            await audit_log_service.log_audit_event(
+            audit_log_service.log_audit_event(
                 action=AuditAction.DELETE,
                 resource_type="file",
                 resource_id=file_id,
@@ -334,7 +334,7 @@ class FileDeletionService:
             await self._invalidate_related_caches(file_id)
 
             # 감사 로그 기록
-            await audit_log_service.log_audit_event(
+            audit_log_service.log_audit_event(
                 action=AuditAction.UPDATE,
                 resource_type="file",
                 resource_id=file_id,
@@ -356,7 +356,7 @@ class FileDeletionService:
             logger.error(f"파일 복원 실패: {e}")
 
             # 감사 로그 기록
-            await audit_log_service.log_audit_event(
+            audit_log_service.log_audit_event(
                 action=AuditAction.UPDATE,
                 resource_type="file",
                 resource_id=file_id,
@@ -555,7 +555,7 @@ class FileDeletionService:
             await self._invalidate_related_caches(file_id)
 
             # 감사 로그 기록
-            await audit_log_service.log_audit_event(
+            audit_log_service.log_audit_event(
                 action=AuditAction.UPDATE,
                 resource_type="file",
                 resource_id=file_id,
@@ -579,7 +579,7 @@ class FileDeletionService:
             logger.error(f"백업에서 파일 복원 실패: {e}")
 
             # 감사 로그 기록
-            await audit_log_service.log_audit_event(
+            audit_log_service.log_audit_event(
                 action=AuditAction.UPDATE,
                 resource_type="file",
                 resource_id=file_id,
@@ -4,7 +4,6 @@ Task 11: 파일 목록 조회 및 검색 API
 """
 
 import asyncio
-import json
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
@@ -14,6 +13,7 @@ from sqlalchemy.orm import Session
 
 # Redis 클라이언트 제거됨
 from app.database import get_db
+from app.utils.json_utils import dumps, loads
 from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -84,7 +84,7 @@ class FileListService:
             cached_result = await redis_client.get(cache_key)
 
             if cached_result:
-                return json.loads(cached_result)
+                return loads(cached_result)
 
             # DB에서 조회
             result = await self._query_files_from_db(
@@ -103,9 +103,7 @@ class FileListService:
             )
 
             # 결과를 캐시에 저장
-            await redis_client.set_with_ttl(
-                cache_key, json.dumps(result), self.cache_ttl
-            )
+            await redis_client.set_with_ttl(cache_key, dumps(result), self.cache_ttl)
 
             return result
 
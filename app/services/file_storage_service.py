@@ -2,7 +2,6 @@
 파일 저장 및 중복 관리 서비스
 """
 
-import hashlib
 import os
 import shutil
 from datetime import datetime
@@ -14,8 +13,12 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models.orm_models import FileInfo
+from app.utils.file_utils import calculate_content_hash_async
+from app.utils.logging_config import get_logger
 from app.utils.security_utils import generate_uuid
 
+logger = get_logger(__name__)
+
 
 class FileStorageService:
     """파일 저장 및 중복 관리 서비스"""
@@ -47,7 +50,7 @@ class FileStorageService:
         try:
             # 1. 파일 내용 읽기 및 MD5 해시 계산
             content = await file.read()
-            file_hash = hashlib.md5(content).hexdigest()
+            file_hash = await calculate_content_hash_async(content, "md5")
 
             # 2. 중복 파일 검사
             existing_file = self._check_duplicate_file(file_hash)
@@ -114,7 +117,7 @@ class FileStorageService:
             return existing_file
         except Exception as e:
             # 데이터베이스 오류 시 로그만 남기고 None 반환
-            print(f"중복 파일 검사 중 오류: {e}")
+            logger.error(f"중복 파일 검사 중 오류: {e}")
             return None
 
     def _create_storage_path(self, file_uuid: str, stored_filename: str) -> Path:
@@ -274,7 +277,7 @@ class FileStorageService:
 
         except Exception as e:
             # 정리 실패는 로그만 남기고 예외를 발생시키지 않음
-            print(f"업로드 실패 정리 중 오류: {e}")
+            logger.error(f"업로드 실패 정리 중 오류: {e}")
 
     def get_file_path(self, file_uuid: str) -> Optional[Path]:
         """
@@ -303,7 +306,7 @@ class FileStorageService:
             return self._find_file_by_uuid(file_uuid)
 
         except Exception as e:
-            print(f"파일 경로 조회 중 오류: {e}")
+            logger.error(f"파일 경로 조회 중 오류: {e}")
             return None
 
     def _find_file_by_uuid(self, file_uuid: str) -> Optional[Path]:
@@ -391,7 +394,7 @@ class FileStorageService:
             return True
 
         except Exception as e:
-            print(f"파일 삭제 중 오류: {e}")
+            logger.error(f"파일 삭제 중 오류: {e}")
             return False
 
     def _cleanup_empty_directories(self, directory: Path) -> None:
@@ -412,7 +415,7 @@ class FileStorageService:
                     else:
                         break
         except Exception as e:
-            print(f"빈 디렉토리 정리 중 오류: {e}")
+            logger.error(f"빈 디렉토리 정리 중 오류: {e}")
 
     def get_storage_stats(self) -> Dict[str, Any]:
         """
@@ -460,7 +463,7 @@ class FileStorageService:
             }
 
         except Exception as e:
-            print(f"저장소 통계 조회 중 오류: {e}")
+            logger.error(f"저장소 통계 조회 중 오류: {e}")
             return {
                 "error": str(e),
                 "storage_structure": settings.storage_structure,
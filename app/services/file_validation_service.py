@@ -15,6 +15,38 @@ from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 파일명에 허용되지 않는 문자
+FORBIDDEN_FILENAME_CHARS = ("<", ">", ":", '"', "|", "?", "*", "\\", "/")
+
+# 파일 내용에서 검사하는 악성 패턴 (원본 표기, 소문자 비교용) 쌍
+MALICIOUS_CONTENT_PATTERNS = tuple(
+    (pattern, pattern.lower())
+    for pattern in (
+        "<?php",
+        "<script",
+        "javascript:",
+        "vbscript:",
+        "data:text/html",
+        "eval(",
+        "document.cookie",
+        "window.location",
+        "alert(",
+        "exec(",
+        "system(",
+        "shell_exec(",
+        "passthru(",
+        "base64_decode(",
+        "gzinflate(",
+        "str_rot13(",
+        "<?=",
+        "<? ",
+        "<%",
+        "<% ",
+        "<script>",
+        "</script>",
+    )
+)
+
 
 class FileValidationService:
     """파일 업로드 유효성 검사 서비스"""
@@ -190,8 +222,7 @@ class FileValidationService:
                 )
 
         # 특수 문자 검사
-        forbidden_chars = ["<", ">", ":", '"', "|", "?", "*", "\\", "/"]
-        for char in forbidden_chars:
+        for char in FORBIDDEN_FILENAME_CHARS:
             if char in filename:
                 return False, f"허용되지 않는 문자가 포함되어 있습니다: {char}"
 
@@ -257,36 +288,12 @@ class FileValidationService:
     def validate_file_content(self, file_content: bytes) -> Tuple[bool, str]:
         """파일 내용 검증 (악성 패턴 검사)"""
         try:
-            content_str = file_content.decode("utf-8", errors="ignore")
+            # 패턴마다 전체 내용을 다시 소문자로 바꾸지 않도록 한 번만 변환
+            content_lower = file_content.decode("utf-8", errors="ignore").lower()
 
             # 악성 패턴 검사
-            malicious_patterns = [
-                "<?php",
-                "<script",
-                "javascript:",
-                "vbscript:",
-                "data:text/html",
-                "eval(",
-                "document.cookie",
-                "window.location",
-                "alert(",
-                "exec(",
-                "system(",
-                "shell_exec(",
-                "passthru(",
-                "base64_decode(",
-                "gzinflate(",
-                "str_rot13(",
-                "<?=",
-                "<? ",
-                "<%",
-                "<% ",
-                "<script>",
-                "</script>",
-            ]
-
-            for pattern in malicious_patterns:
-                if pattern.lower() in content_str.lower():
+            for pattern, pattern_lower in MALICIOUS_CONTENT_PATTERNS:
+                if pattern_lower in content_lower:
                     return False, f"악성 코드 패턴이 감지되었습니다: {pattern}"
 
             return True, "파일 내용이 유효합니다."
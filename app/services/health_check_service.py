@@ -7,7 +7,7 @@ import asyncio
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -18,6 +18,9 @@ from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 애플리케이션 프로세스 정보 캐시 유지 시간 (초)
+APPLICATION_INFO_TTL = 5.0
+
 
 class HealthCheckService:
     """헬스체크 서비스"""
@@ -29,6 +32,8 @@ class HealthCheckService:
             "version": "1.0.0",
             "checks": {},
         }
+        # (수집 시각, 애플리케이션 정보) - 짧은 간격의 반복 헬스체크에서 재사용
+        self._application_info_cache: Tuple[float, Dict[str, Any]] = (0.0, {})
 
     async def check_database_health(self) -> Dict[str, Any]:
         """데이터베이스 연결 상태 확인"""
@@ -206,22 +211,40 @@ class HealthCheckService:
                 "message": f"External services check failed: {str(e)}",
             }
 
+    def _collect_application_info(self) -> Dict[str, Any]:
+        """프로세스 메모리/CPU/스레드 정보 수집 (TTL 동안 캐시)"""
+        now = time.monotonic()
+        cached_at, cached_info = self._application_info_cache
+        if cached_info and now - cached_at < APPLICATION_INFO_TTL:
+            return cached_info
+
+        # 메모리 사용량 확인
+        import psutil
+
+        process = psutil.Process()
+        memory_info = process.memory_info()
+
+        # CPU 사용량 확인 (interval 동안 블로킹되므로 캐시로 호출 횟수를 줄임)
+        cpu_percent = process.cpu_percent(interval=0.1)
+
+        # 스레드 수 확인
+        thread_count = process.num_threads()
+
+        info = {
+            "memory_usage_mb": round(memory_info.rss / (1024**2), 2),
+            "cpu_percent": round(cpu_percent, 2),
+            "thread_count": thread_count,
+            "process_id": process.pid,
+        }
+        self._application_info_cache = (time.monotonic(), info)
+        return info
+
     async def check_application_health(self) -> Dict[str, Any]:
         """애플리케이션 상태 확인"""
         try:
             start_time = time.time()
 
-            # 메모리 사용량 확인
-            import psutil
-
-            process = psutil.Process()
-            memory_info = process.memory_info()
-
-            # CPU 사용량 확인
-            cpu_percent = process.cpu_percent(interval=0.1)
-
-            # 스레드 수 확인
-            thread_count = process.num_threads()
+            application_info = self._collect_application_info()
 
             duration = time.time() - start_time
 
@@ -229,12 +252,7 @@ class HealthCheckService:
                 "status": "healthy",
                 "duration_ms": round(duration * 1000, 2),
                 "message": "Application health check successful",
-                "application_info": {
-                    "memory_usage_mb": round(memory_info.rss / (1024**2), 2),
-                    "cpu_percent": round(cpu_percent, 2),
-                    "thread_count": thread_count,
-                    "process_id": process.pid,
-                },
+                "application_info": dict(application_info),
             }
 
         except Exception as e:
@@ -304,10 +322,11 @@ class HealthCheckService:
                 ),
             }
 
-            # 전체 상태 결정
-            all_healthy = all(
-                check["status"] == "healthy" for check in check_results.values()
+            # 전체 상태 결정 (정상 개수를 한 번만 집계)
+            healthy_checks = sum(
+                1 for check in check_results.values() if check["status"] == "healthy"
             )
+            all_healthy = healthy_checks == len(check_results)
 
             total_duration = time.time() - start_time
 
@@ -319,16 +338,8 @@ class HealthCheckService:
                 "checks": check_results,
                 "summary": {
                     "total_checks": len(check_results),
-                    "healthy_checks": sum(
-                        1
-                        for check in check_results.values()
-                        if check["status"] == "healthy"
-                    ),
-                    "unhealthy_checks": sum(
-                        1
-                        for check in check_results.values()
-                        if check["status"] == "unhealthy"
-                    ),
+                    "healthy_checks": healthy_checks,
+                    "unhealthy_checks": len(check_results) - healthy_checks,
                 },
             }
 
@@ -10,11 +10,22 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, case, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.orm_models import AllowedIP, IPAuthLog, IPRateLimit
-from app.utils.security_utils import generate_encryption_key, hash_key
+from app.utils.logging_config import get_logger
+from app.utils.security_utils import (
+    generate_encryption_key,
+    get_client_ip,
+    hash_key,
+)
+
+logger = get_logger(__name__)
+
+# 인스턴스마다 새로 만들지 않고 공유하는 Bearer 스킴
+security = HTTPBearer()
 
 
 class IPAuthService:
@@ -22,23 +33,11 @@ class IPAuthService:
 
     def __init__(self, db_session: Session):
         self.db = db_session
-        self.security = HTTPBearer()
+        self.security = security
 
     def get_client_ip(self, request: Request) -> str:
         """클라이언트 IP 주소 추출"""
-        # X-Forwarded-For 헤더 확인 (프록시 환경)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            # 첫 번째 IP 주소 사용 (클라이언트 IP)
-            return forwarded_for.split(",")[0].strip()
-
-        # X-Real-IP 헤더 확인
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-
-        # 기본 클라이언트 IP
-        return request.client.host
+        return get_client_ip(request)
 
     def verify_ip_and_key(self, client_ip: str, api_key: str) -> Optional[AllowedIP]:
         """IP 주소와 암호화 키 검증"""
@@ -98,34 +97,11 @@ class IPAuthService:
             current_time = datetime.utcnow()
             window_start = current_time.replace(minute=0, second=0, microsecond=0)
 
-            # 현재 시간대의 요청 수 확인
-            rate_limit = (
-                self.db.query(IPRateLimit)
-                .filter(
-                    and_(
-                        IPRateLimit.ip_address == client_ip,
-                        IPRateLimit.api_key_hash == key_hash,
-                        IPRateLimit.window_start == window_start,
-                    )
-                )
-                .first()
+            # 현재 시간대의 요청 수를 원자적으로 증가시키고 그 결과로 판정
+            request_count = self._increment_request_count(
+                client_ip, key_hash, window_start, current_time
             )
 
-            if not rate_limit:
-                # 새로운 시간대 시작
-                rate_limit = IPRateLimit(
-                    ip_address=client_ip,
-                    api_key_hash=key_hash,
-                    window_start=window_start,
-                    request_count=1,
-                    last_request_at=current_time,
-                )
-                self.db.add(rate_limit)
-            else:
-                # 기존 시간대 업데이트
-                rate_limit.request_count += 1
-                rate_limit.last_request_at = current_time
-
             # 허용된 IP 정보 조회
             allowed_ip = (
                 self.db.query(AllowedIP)
@@ -148,7 +124,7 @@ class IPAuthService:
 
             # 요청 수 제한 확인
             max_requests = allowed_ip.max_uploads_per_hour if allowed_ip else 100
-            is_limited = rate_limit.request_count > max_requests
+            is_limited = request_count > max_requests
 
             self.db.commit()
             return not is_limited
@@ -163,6 +139,65 @@ class IPAuthService:
             )
             return False
 
+    def _increment_request_count(
+        self,
+        client_ip: str,
+        key_hash: str,
+        window_start: datetime,
+        current_time: datetime,
+    ) -> int:
+        """
+        현재 시간대 요청 수를 DB에서 1 증가시키고 증가된 값을 반환
+
+        조회 후 파이썬에서 +1 하면 동시 요청이 같은 값을 읽고 모두 통과할 수
+        있으므로 UPDATE ... SET request_count = request_count + 1 의 결과를
+        판정 기준으로 사용합니다.
+        """
+        window = and_(
+            IPRateLimit.ip_address == client_ip,
+            IPRateLimit.api_key_hash == key_hash,
+            IPRateLimit.window_start == window_start,
+        )
+        increment = (
+            update(IPRateLimit)
+            .where(window)
+            .values(
+                request_count=IPRateLimit.request_count + 1,
+                last_request_at=current_time,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        if self.db.get_bind().dialect.update_returning:
+            # UPDATE ... RETURNING 지원 DB는 한 번의 왕복으로 결과 확인
+            request_count = self.db.execute(
+                increment.returning(IPRateLimit.request_count)
+            ).scalar()
+            if request_count is not None:
+                return request_count
+        elif self.db.execute(increment).rowcount:
+            # 갱신된 행은 트랜잭션 종료까지 잠겨 있으므로 조회 값이 곧 증가 결과
+            return self.db.query(IPRateLimit.request_count).filter(window).scalar()
+
+        # 새로운 시간대 시작
+        try:
+            with self.db.begin_nested():
+                self.db.add(
+                    IPRateLimit(
+                        ip_address=client_ip,
+                        api_key_hash=key_hash,
+                        window_start=window_start,
+                        request_count=1,
+                        last_request_at=current_time,
+                    )
+                )
+            return 1
+        except IntegrityError:
+            # 동시 요청이 같은 시간대 행을 먼저 만든 경우 다시 증가
+            return self._increment_request_count(
+                client_ip, key_hash, window_start, current_time
+            )
+
     def log_auth_event(
         self,
         client_ip: str,
@@ -179,42 +214,41 @@ class IPAuthService:
         try:
             key_hash = hash_key(api_key) if api_key else None
 
-            # 허용된 IP 정보 조회
+            # 허용된 IP 정보는 스칼라 서브쿼리로 INSERT 안에서 조회
+            # (SELECT + INSERT 두 번의 왕복을 한 번으로 줄임)
             allowed_ip_id = None
             if key_hash:
-                allowed_ip = (
-                    self.db.query(AllowedIP)
-                    .filter(
+                allowed_ip_id = (
+                    select(AllowedIP.id)
+                    .where(
                         and_(
                             AllowedIP.is_active == True, AllowedIP.key_hash == key_hash
                         )
                     )
-                    .first()
+                    .limit(1)
+                    .scalar_subquery()
                 )
-                if allowed_ip:
-                    allowed_ip_id = allowed_ip.id
-
-            # 로그 생성
-            auth_log = IPAuthLog(
-                ip_address=client_ip,
-                allowed_ip_id=allowed_ip_id,
-                api_key_hash=key_hash,
-                action=action,
-                file_uuid=file_uuid,
-                user_agent=user_agent,
-                response_code=response_code,
-                error_message=error_message,
-                request_size=request_size,
-                processing_time_ms=processing_time_ms,
-            )
 
-            self.db.add(auth_log)
+            self.db.execute(
+                insert(IPAuthLog).values(
+                    ip_address=client_ip,
+                    allowed_ip_id=allowed_ip_id,
+                    api_key_hash=key_hash,
+                    action=action,
+                    file_uuid=file_uuid,
+                    user_agent=user_agent,
+                    response_code=response_code,
+                    error_message=error_message,
+                    request_size=request_size,
+                    processing_time_ms=processing_time_ms,
+                )
+            )
             self.db.commit()
 
         except Exception as e:
             self.db.rollback()
             # 로깅 실패 시에도 애플리케이션은 계속 실행
-            print(f"Auth log error: {str(e)}")
+            logger.error(f"Auth log error: {str(e)}")
 
     def _log_auth_event(
         self,
@@ -233,42 +267,52 @@ class IPAuthService:
         try:
             start_date = datetime.utcnow() - timedelta(days=days)
 
-            query = self.db.query(IPAuthLog).filter(
-                IPAuthLog.request_time >= start_date
-            )
-
+            filters = [IPAuthLog.request_time >= start_date]
             if ip_address:
-                query = query.filter(IPAuthLog.ip_address == ip_address)
-
-            # 전체 요청 수
-            total_requests = query.count()
+                filters.append(IPAuthLog.ip_address == ip_address)
 
-            # 성공한 업로드 수
-            successful_uploads = query.filter(
-                and_(IPAuthLog.action == "upload", IPAuthLog.response_code == 200)
-            ).count()
-
-            # 실패한 요청 수
-            failed_requests = (
-                query.filter(IPAuthLog.response_code.isnot(None))
-                .filter(IPAuthLog.response_code >= 400)
-                .count()
+            # 전체/성공/실패/Rate limited 건수를 단일 집계 쿼리로 조회
+            totals = (
+                self.db.query(
+                    func.count().label("total_requests"),
+                    func.sum(
+                        case(
+                            (
+                                and_(
+                                    IPAuthLog.action == "upload",
+                                    IPAuthLog.response_code == 200,
+                                ),
+                                1,
+                            ),
+                            else_=0,
+                        )
+                    ).label("successful_uploads"),
+                    func.sum(case((IPAuthLog.response_code >= 400, 1), else_=0)).label(
+                        "failed_requests"
+                    ),
+                    func.sum(
+                        case((IPAuthLog.action == "rate_limited", 1), else_=0)
+                    ).label("rate_limited"),
+                )
+                .filter(*filters)
+                .one()
             )
-
-            # Rate limited 요청 수
-            rate_limited = query.filter(IPAuthLog.action == "rate_limited").count()
+            total_requests = totals.total_requests or 0
+            successful_uploads = int(totals.successful_uploads or 0)
+            failed_requests = int(totals.failed_requests or 0)
+            rate_limited = int(totals.rate_limited or 0)
 
             # 일별 통계
             daily_stats = (
                 self.db.query(
                     func.date(IPAuthLog.request_time).label("date"),
                     func.count().label("total"),
-                    func.sum(
-                        func.case([(IPAuthLog.action == "upload", 1)], else_=0)
-                    ).label("uploads"),
-                    func.sum(
-                        func.case([(IPAuthLog.response_code >= 400, 1)], else_=0)
-                    ).label("errors"),
+                    func.sum(case((IPAuthLog.action == "upload", 1), else_=0)).label(
+                        "uploads"
+                    ),
+                    func.sum(case((IPAuthLog.response_code >= 400, 1), else_=0)).label(
+                        "errors"
+                    ),
                 )
                 .filter(IPAuthLog.request_time >= start_date)
                 .group_by(func.date(IPAuthLog.request_time))
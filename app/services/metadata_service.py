@@ -17,7 +17,10 @@ from app.models.orm_models import (
     FileUpload,
     SystemSetting,
 )
-from app.utils.security_utils import generate_uuid
+from app.utils.logging_config import get_logger
+from app.utils.security_utils import generate_uuid, get_client_ip
+
+logger = get_logger(__name__)
 
 
 class MetadataService:
@@ -61,6 +64,9 @@ class MetadataService:
             # 트랜잭션 시작
             self.db_session.begin()
 
+            # 한 번의 저장에서 기록되는 모든 시각은 동일한 값을 사용
+            now = datetime.now()
+
             # 1. files 테이블에 파일 정보 저장
             file_info = FileInfo(
                 file_uuid=file_uuid,
@@ -75,8 +81,8 @@ class MetadataService:
                 is_public=metadata.get("is_public", True) if metadata else True,
                 is_deleted=False,
                 description=metadata.get("description") if metadata else None,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+                created_at=now,
+                updated_at=now,
             )
 
             self.db_session.add(file_info)
@@ -88,8 +94,8 @@ class MetadataService:
                 upload_status="success",
                 upload_ip=self._get_client_ip(request),
                 user_agent=request.headers.get("user-agent"),
-                upload_time=datetime.now(),
-                created_at=datetime.now(),
+                upload_time=now,
+                created_at=now,
             )
 
             self.db_session.add(upload_record)
@@ -97,12 +103,12 @@ class MetadataService:
             # 3. 태그 처리
             tags = metadata.get("tags", []) if metadata else []
             if tags:
-                await self._process_tags(file_uuid, tags)
+                self._process_tags(file_uuid, tags, now)
 
             # 4. 카테고리 처리
             category_id = metadata.get("category_id") if metadata else None
             if category_id:
-                await self._validate_category(category_id)
+                self._validate_category(category_id)
 
             # 트랜잭션 커밋
             self.db_session.commit()
@@ -136,14 +142,20 @@ class MetadataService:
                 status_code=500, detail=f"메타데이터 저장 실패: {str(e)}"
             )
 
-    async def _process_tags(self, file_uuid: str, tags: List[str]) -> None:
+    def _process_tags(
+        self, file_uuid: str, tags: List[str], now: Optional[datetime] = None
+    ) -> None:
         """
         태그 처리 (생성 및 관계 설정)
 
         Args:
             file_uuid: 파일 UUID
             tags: 태그 목록
+            now: 생성 시각 (None이면 현재 시각)
         """
+        if now is None:
+            now = datetime.now()
+
         for tag_name in tags:
             # 태그 정규화 (소문자, 공백 제거)
             normalized_tag = tag_name.lower().strip()
@@ -161,7 +173,7 @@ class MetadataService:
                 tag = FileTag(
                     name=normalized_tag,
                     display_name=tag_name,
-                    created_at=datetime.now(),
+                    created_at=now,
                 )
                 self.db_session.add(tag)
                 self.db_session.flush()  # ID 생성
@@ -178,11 +190,11 @@ class MetadataService:
 
             if not existing_relation:
                 tag_relation = FileTagRelation(
-                    file_uuid=file_uuid, tag_id=tag.id, created_at=datetime.now()
+                    file_uuid=file_uuid, tag_id=tag.id, created_at=now
                 )
                 self.db_session.add(tag_relation)
 
-    async def _validate_category(self, category_id: int) -> None:
+    def _validate_category(self, category_id: int) -> None:
         """
         카테고리 유효성 검증
 
@@ -213,18 +225,7 @@ class MetadataService:
         Returns:
             클라이언트 IP 주소
         """
-        # X-Forwarded-For 헤더 확인 (프록시 환경)
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-
-        # X-Real-IP 헤더 확인
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-
-        # 기본 클라이언트 IP
-        return request.client.host if request.client else "unknown"
+        return get_client_ip(request)
 
     def get_file_metadata(self, file_uuid: str) -> Optional[Dict[str, Any]]:
         """
@@ -306,7 +307,7 @@ class MetadataService:
             }
 
         except Exception as e:
-            print(f"메타데이터 조회 중 오류: {e}")
+            logger.error(f"메타데이터 조회 중 오류: {e}")
             return None
 
     def update_file_metadata(self, file_uuid: str, updates: Dict[str, Any]) -> bool:
@@ -349,14 +350,14 @@ class MetadataService:
 
                 # 새 태그 처리
                 if updates["tags"]:
-                    asyncio.create_task(self._process_tags(file_uuid, updates["tags"]))
+                    self._process_tags(file_uuid, updates["tags"])
 
             self.db_session.commit()
             return True
 
         except Exception as e:
             self.db_session.rollback()
-            print(f"메타데이터 업데이트 중 오류: {e}")
+            logger.error(f"메타데이터 업데이트 중 오류: {e}")
             return False
 
     def get_upload_statistics(self, days: int = 30) -> Dict[str, Any]:
@@ -428,5 +429,5 @@ class MetadataService:
             }
 
         except Exception as e:
-            print(f"업로드 통계 조회 중 오류: {e}")
+            logger.error(f"업로드 통계 조회 중 오류: {e}")
             return {}
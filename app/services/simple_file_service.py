@@ -1,7 +1,6 @@
 """
 Simplified file service without Redis dependencies
 """
-import hashlib
 import os
 import uuid
 from datetime import datetime
@@ -13,6 +12,7 @@ from sqlalchemy.orm import Session
 
 from app.core.config import get_config
 from app.models.orm_models import FileInfo
+from app.utils.file_utils import calculate_content_hash_async
 from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -38,7 +38,7 @@ class SimpleFileService:
             file_size = len(content)
             
             # Calculate file hash
-            file_hash = hashlib.sha256(content).hexdigest()
+            file_hash = await calculate_content_hash_async(content, "sha256")
             
             # Check for duplicates
             existing_file = self.db_session.query(FileInfo).filter(
@@ -23,6 +23,7 @@ from app.models.orm_models import (
     FileView,
     SystemSetting,
 )
+from app.utils.json_utils import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -56,9 +57,9 @@ class DatabaseHelpers:
             self.db_session.add(file_info)
             self.db_session.flush()  # ID 생성
 
-            # 태그 추가
+            # 태그 추가 (커밋은 아래에서 한 번만 수행)
             if tags:
-                self.add_tags_to_file(file_info.id, tags)
+                self.add_tags_to_file(file_info.id, tags, commit=False)
 
             self.db_session.commit()
             return file_info
@@ -186,8 +187,13 @@ class DatabaseHelpers:
 
     # ==================== 태그 관리 헬퍼 함수들 ====================
 
-    def add_tags_to_file(self, file_id: int, tag_names: List[str]) -> bool:
-        """파일에 태그 일괄 추가 (개선된 버전)"""
+    def add_tags_to_file(
+        self, file_id: int, tag_names: List[str], commit: bool = True
+    ) -> bool:
+        """파일에 태그 일괄 추가 (개선된 버전)
+
+        commit=False 이면 호출자의 트랜잭션에 포함되어 커밋을 호출자에게 맡긴다.
+        """
         try:
             for tag_name in tag_names:
                 # 태그가 존재하는지 확인
@@ -216,7 +222,8 @@ class DatabaseHelpers:
                     relation = FileTagRelation(file_id=file_id, tag_id=tag.id)
                     self.db_session.add(relation)
 
-            self.db_session.commit()
+            if commit:
+                self.db_session.commit()
             return True
 
         except Exception as e:
@@ -563,10 +570,8 @@ class DatabaseHelpers:
                         else default
                     )
                 elif setting.setting_type == "json":
-                    import json
-
                     return (
-                        json.loads(setting.setting_value)
+                        loads(setting.setting_value)
                         if setting.setting_value
                         else default
                     )
@@ -590,9 +595,7 @@ class DatabaseHelpers:
         try:
             # 타입에 따른 값 변환
             if setting_type == "json":
-                import json
-
-                value_str = json.dumps(value)
+                value_str = dumps(value)
             else:
                 value_str = str(value)
 
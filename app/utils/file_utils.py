@@ -2,10 +2,22 @@
 파일 유틸리티 함수들
 """
 
+import asyncio
 import hashlib
 import os
+import ssl
+import weakref
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict
+
+# 이 크기 미만의 데이터는 스레드 전환 비용이 더 크므로 이벤트 루프에서 바로 해시
+HASH_OFFLOAD_THRESHOLD = 64 * 1024
+
+# 스레드로 넘겨 동시에 실행하는 해시 작업 수 상한 (초과 요청은 대기)
+HASH_MAX_CONCURRENCY = os.cpu_count() or 1
+
+# 이벤트 루프별 해시 작업 세마포어
+_hash_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
 
 
 def calculate_file_hash(file_path: Path, algorithm: str = "md5") -> str:
@@ -28,6 +40,81 @@ def calculate_file_hash(file_path: Path, algorithm: str = "md5") -> str:
     return hash_func.hexdigest()
 
 
+def calculate_content_hash(content: bytes, algorithm: str = "sha256") -> str:
+    """
+    메모리에 있는 데이터의 해시 계산
+
+    Args:
+        content: 데이터
+        algorithm: 해시 알고리즘 (md5, sha1, sha256)
+
+    Returns:
+        해시 문자열
+    """
+    return hashlib.new(algorithm, content).hexdigest()
+
+
+async def calculate_content_hash_async(
+    content: bytes, algorithm: str = "sha256"
+) -> str:
+    """
+    데이터 해시를 이벤트 루프를 막지 않도록 스레드에서 계산
+
+    hashlib은 큰 입력을 처리하는 동안 GIL을 해제하므로 스레드에서도
+    다른 요청 처리와 병렬로 실행됩니다.
+    """
+    if len(content) < HASH_OFFLOAD_THRESHOLD:
+        return calculate_content_hash(content, algorithm)
+    return await _run_hash_in_thread(calculate_content_hash, content, algorithm)
+
+
+def _get_hash_semaphore() -> asyncio.Semaphore:
+    """현재 이벤트 루프의 해시 작업 세마포어 조회 (없으면 생성)"""
+    loop = asyncio.get_running_loop()
+    semaphore = _hash_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(HASH_MAX_CONCURRENCY)
+        _hash_semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _run_hash_in_thread(func: Callable[..., str], *args: Any) -> str:
+    """
+    해시 함수를 스레드에서 실행
+
+    동시에 실행되는 작업을 HASH_MAX_CONCURRENCY개로 제한해 업로드가 몰려도
+    해시 스레드 수와 메모리 사용량이 무한정 늘어나지 않도록 합니다.
+    """
+    async with _get_hash_semaphore():
+        return await asyncio.to_thread(func, *args)
+
+
+def get_hash_backend_info() -> Dict[str, Any]:
+    """
+    해시 계산 백엔드 정보 조회
+
+    Returns:
+        OpenSSL 버전, CPU SHA 확장 지원 여부(확인 불가 시 None), 사용 가능한 알고리즘
+    """
+    sha_extensions = None
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            flags = set()
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    flags.update(line.partition(":")[2].split())
+        # x86: sha_ni, ARM: sha2
+        sha_extensions = "sha_ni" in flags or "sha2" in flags
+    except OSError:
+        pass
+
+    return {
+        "openssl_version": ssl.OPENSSL_VERSION,
+        "sha_extensions": sha_extensions,
+        "algorithms": sorted(hashlib.algorithms_available),
+    }
+
+
 def get_file_extension(filename: str) -> str:
     """
     파일명에서 확장자 추출
@@ -0,0 +1,67 @@
+"""
+JSON 직렬화 유틸리티
+
+orjson(C 확장)이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 대체합니다.
+두 경우 모두 공백 없는 구분자와 이스케이프하지 않은 비 ASCII 문자를 사용하고,
+datetime/date/time은 ISO 8601 문자열로 변환하므로 출력 형식이 같습니다.
+"""
+
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # 선택적 의존성
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """orjson이 기본 지원하는 타입은 같은 형식으로, 나머지는 str()로 변환"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    """표준 json 모듈로 orjson과 같은 형식의 JSON 문자열 생성"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default)
+
+
+def dumps(obj: Any) -> str:
+    """
+    객체를 JSON 문자열로 직렬화
+
+    Args:
+        obj: 직렬화할 객체 (직렬화할 수 없는 값은 str()로 변환)
+
+    Returns:
+        JSON 문자열
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # 64비트 범위를 넘는 정수 등 orjson이 거부하는 값은 표준 모듈로 처리
+            return _stdlib_dumps(obj)
+    return _stdlib_dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    JSON 문자열/바이트를 파싱
+
+    Args:
+        data: JSON 문자열 또는 바이트
+
+    Returns:
+        파싱된 객체
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
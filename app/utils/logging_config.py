@@ -2,13 +2,76 @@
 Structured logging configuration for the application.
 """
 
+import copy
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from app.config import get_settings
+from app.utils.json_utils import dumps
+
+# 파일 핸들러를 구동하는 백그라운드 리스너 목록 (로거, 큐 핸들러, 리스너)
+_queue_listeners: List[
+    Tuple[logging.Logger, logging.Handler, logging.handlers.QueueListener]
+] = []
+
+
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """
+    메시지 인자만 병합하고 포맷은 리스너 스레드의 핸들러에 맡기는 QueueHandler
+
+    기본 QueueHandler.prepare()는 호출 스레드에서 레코드를 포맷하고 예외 정보를
+    제거하므로, 대상 핸들러의 포맷터(JSONFormatter 등)가 그대로 적용되도록
+    재정의합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def add_queued_handler(logger: logging.Logger, handler: logging.Handler) -> None:
+    """
+    핸들러를 QueueHandler + QueueListener 뒤에 연결
+
+    디스크 쓰기/로테이션은 리스너 스레드에서 수행되고, 로그를 남기는 쪽
+    (이벤트 루프 포함)은 큐에 넣기만 하므로 블로킹되지 않습니다.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _DeferredFormatQueueHandler(log_queue)
+    queue_handler.setLevel(handler.level)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True
+    )
+    listener.start()
+    _queue_listeners.append((logger, queue_handler, listener))
+
+    logger.addHandler(queue_handler)
+
+
+def stop_queue_listeners(logger: Optional[logging.Logger] = None) -> None:
+    """
+    큐에 남은 로그를 모두 기록하고 리스너 스레드 종료
+
+    Args:
+        logger: 지정하면 해당 로거에 연결된 리스너만 종료
+    """
+    for entry in _queue_listeners[:]:
+        target, queue_handler, listener = entry
+        if logger is not None and target is not logger:
+            continue
+
+        _queue_listeners.remove(entry)
+        target.removeHandler(queue_handler)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
 
 
 def setup_logging(
@@ -38,9 +101,10 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # 기존 핸들러 제거
+    # 기존 핸들러 및 리스너 제거
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    stop_queue_listeners(root_logger)
 
     # 콘솔 핸들러 추가
     console_handler = logging.StreamHandler(sys.stdout)
@@ -59,7 +123,7 @@ def setup_logging(
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        add_queued_handler(root_logger, file_handler)
 
     # 특정 로거들의 레벨 조정
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -97,7 +161,6 @@ class JSONFormatter(logging.Formatter):
     """JSON 형식 로그 포맷터"""
 
     def format(self, record):
-        import json
         from datetime import datetime
 
         log_entry = {
@@ -118,7 +181,7 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        return dumps(log_entry)
 
 
 def setup_json_logging(log_file: str) -> None:
@@ -143,6 +206,6 @@ def setup_json_logging(log_file: str) -> None:
     json_handler.setLevel(getattr(logging, settings.log_level.upper()))
     json_handler.setFormatter(json_formatter)
 
-    # 루트 로거에 추가
+    # 루트 로거에 추가 (파일 쓰기는 리스너 스레드에서 수행)
     root_logger = logging.getLogger()
-    root_logger.addHandler(json_handler)
+    add_queued_handler(root_logger, json_handler)
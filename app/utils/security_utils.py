@@ -9,6 +9,8 @@ import string
 import uuid
 from typing import Optional
 
+from fastapi import Request
+
 
 def generate_encryption_key(length: int = 32) -> str:
     """암호화 키 생성"""
@@ -53,6 +55,28 @@ def sanitize_ip_address(ip_address: str) -> str:
     return ip_address.strip()
 
 
+def get_client_ip(request: Request) -> str:
+    """클라이언트 IP 주소 추출 (요청 단위로 request.state에 캐시)"""
+    state = getattr(request, "state", None)
+    cached_ip = getattr(state, "client_ip", None)
+    if isinstance(cached_ip, str):
+        return cached_ip
+
+    # X-Forwarded-For 헤더 확인 (프록시 환경), 첫 번째 IP 주소 사용
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if forwarded_for:
+        client_ip = forwarded_for.partition(",")[0].strip()
+    else:
+        # X-Real-IP 헤더 확인, 없으면 기본 클라이언트 IP
+        client_ip = request.headers.get("x-real-ip") or (
+            request.client.host if request.client else "unknown"
+        )
+
+    if state is not None:
+        state.client_ip = client_ip
+    return client_ip
+
+
 def is_valid_ip_address(ip_address: str) -> bool:
     """IP 주소 유효성 검사"""
     try:
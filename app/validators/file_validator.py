@@ -11,6 +11,9 @@ from sqlalchemy.orm import Session
 
 from app.models.orm_models import FileExtension
 from app.utils.database_helpers import DatabaseHelpers
+from app.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class FileValidator:
@@ -88,7 +91,7 @@ class FileValidator:
 
         try:
             # 1. 파일 확장자 검증
-            extension_validation = await self._validate_extension(file)
+            extension_validation = self._validate_extension(file)
             if not extension_validation["is_valid"]:
                 validation_result["is_valid"] = False
                 validation_result["errors"].extend(extension_validation["errors"])
@@ -111,7 +114,7 @@ class FileValidator:
                 ]
 
             # 3. MIME 타입 검증
-            mime_validation = await self._validate_mime_type(file)
+            mime_validation = self._validate_mime_type(file)
             if not mime_validation["is_valid"]:
                 validation_result["warnings"].extend(mime_validation["warnings"])
 
@@ -121,7 +124,7 @@ class FileValidator:
                 validation_result["warnings"].extend(signature_validation["warnings"])
 
             # 5. 위험한 파일 검증
-            security_validation = await self._validate_security(file)
+            security_validation = self._validate_security(file)
             if not security_validation["is_valid"]:
                 validation_result["is_valid"] = False
                 validation_result["errors"].extend(security_validation["errors"])
@@ -133,7 +136,7 @@ class FileValidator:
             validation_result["errors"].append(f"검증 중 오류 발생: {str(e)}")
             return validation_result
 
-    async def _validate_extension(self, file: UploadFile) -> Dict[str, any]:
+    def _validate_extension(self, file: UploadFile) -> Dict[str, any]:
         """파일 확장자 검증"""
         result = {"is_valid": True, "errors": [], "extension": None, "mime_type": None}
 
@@ -215,7 +218,7 @@ class FileValidator:
             result["errors"].append(f"파일 크기 검증 중 오류: {str(e)}")
             return result
 
-    async def _validate_mime_type(self, file: UploadFile) -> Dict[str, any]:
+    def _validate_mime_type(self, file: UploadFile) -> Dict[str, any]:
         """MIME 타입 검증"""
         result = {"is_valid": True, "warnings": []}
 
@@ -280,7 +283,7 @@ class FileValidator:
             result["warnings"].append(f"파일 시그니처 검증 중 오류: {str(e)}")
             return result
 
-    async def _validate_security(self, file: UploadFile) -> Dict[str, any]:
+    def _validate_security(self, file: UploadFile) -> Dict[str, any]:
         """보안 검증"""
         result = {"is_valid": True, "errors": []}
 
@@ -322,7 +325,7 @@ class FileValidator:
             )
             return [ext.extension for ext in extensions]
         except Exception as e:
-            print(f"확장자 목록 조회 중 오류: {e}")
+            logger.error(f"확장자 목록 조회 중 오류: {e}")
             return []
 
     def get_file_size_limits(self) -> Dict[str, int]:
@@ -349,7 +352,7 @@ class FileValidator:
 
             return limits
         except Exception as e:
-            print(f"파일 크기 제한 조회 중 오류: {e}")
+            logger.error(f"파일 크기 제한 조회 중 오류: {e}")
             return {"global_max": 104857600, "by_extension": {}}
 
 
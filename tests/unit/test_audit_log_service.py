@@ -0,0 +1,44 @@
+"""
+감사 로그 서비스 테스트
+"""
+
+from unittest.mock import MagicMock
+
+from app.services import audit_log_service as audit_module
+from app.services.audit_log_service import AuditAction, AuditLogService, AuditResult
+
+
+class TestAuditLogService:
+    """AuditLogService 테스트"""
+
+    def test_success_event_is_logged(self, monkeypatch):
+        logger = MagicMock()
+        monkeypatch.setattr(audit_module, "logger", logger)
+
+        AuditLogService().log_audit_event(
+            action=AuditAction.DELETE,
+            resource_type="file",
+            resource_id="file-1",
+            user_ip="127.0.0.1",
+            details={"reason": "테스트"},
+        )
+
+        message = logger.info.call_args.args[0]
+        assert "delete file/file-1 success" in message
+        assert "ip=127.0.0.1" in message
+        logger.warning.assert_not_called()
+
+    def test_failed_event_is_logged_as_warning(self, monkeypatch):
+        logger = MagicMock()
+        monkeypatch.setattr(audit_module, "logger", logger)
+
+        AuditLogService().log_audit_event(
+            action=AuditAction.UPDATE,
+            resource_type="file",
+            resource_id="file-1",
+            result=AuditResult.FAILED,
+            error_message="boom",
+        )
+
+        assert "error=boom" in logger.warning.call_args.args[0]
+        logger.info.assert_not_called()
@@ -0,0 +1,29 @@
+"""
+캐시 서비스 테스트
+"""
+
+from app.services.cache_service import CacheService
+
+
+class TestBoundedCache:
+    """CacheService 만료/크기 제한 테스트"""
+
+    async def test_expired_entry_is_not_returned(self):
+        service = CacheService()
+
+        await service.set("key", "value", expire=0)
+
+        assert await service.get("key") is None
+        assert "key" not in service.cache
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        service = CacheService(max_entries=2)
+
+        await service.set("a", 1)
+        await service.set("b", 2)
+        await service.get("a")
+        await service.set("c", 3)
+
+        assert await service.get("a") == 1
+        assert await service.get("b") is None
+        assert await service.get("c") == 3
@@ -151,6 +151,17 @@ class TestDatabaseHelpers:
         assert result is True
         db_session.commit.assert_called_once()
 
+    def test_add_tags_to_file_without_commit(self, helpers, db_session):
+        """호출자 트랜잭션에 포함된 태그 추가는 커밋하지 않음"""
+        mock_tag = Mock(spec=FileTag)
+        mock_tag.id = 1
+        db_session.query.return_value.filter.return_value.first.return_value = mock_tag
+
+        result = helpers.add_tags_to_file(1, ["tag1"], commit=False)
+
+        assert result is True
+        db_session.commit.assert_not_called()
+
     def test_remove_tags_from_file_success(self, helpers, db_session):
         """태그 제거 성공 테스트"""
         file_id = 1
@@ -7,7 +7,7 @@ import time
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.monitoring import DatabaseMonitor, db_monitor
+from app.database.monitoring import MAX_SLOW_QUERIES_LOG, DatabaseMonitor, db_monitor
 from app.repositories.file_repository import FileRepository
 from app.utils.query_optimizer import QueryOptimizer
 
@@ -16,11 +16,57 @@ from app.utils.query_optimizer import QueryOptimizer
 async def test_database_monitor_initialization():
     """Test database monitor initialization."""
     monitor = DatabaseMonitor()
-    assert monitor.slow_queries == []
+    assert list(monitor.slow_queries) == []
     assert monitor.query_stats == {}
     assert monitor.start_time is not None
 
 
+def test_update_stats_accumulates_totals():
+    """Test per-key stats and running totals."""
+    monitor = DatabaseMonitor()
+
+    monitor._update_stats("SELECT", "files", 0.2, "success")
+    monitor._update_stats("SELECT", "files", 0.1, "error")
+    monitor._update_stats("INSERT", "files", 0.3, "success")
+
+    stats = monitor.query_stats["SELECT_files"]
+    assert stats["count"] == 2
+    assert stats["errors"] == 1
+    assert stats["min_duration"] == 0.1
+    assert stats["max_duration"] == 0.2
+    assert stats["avg_duration"] == pytest.approx(0.15)
+    assert monitor.get_query_stats()["total_queries"] == 3
+    assert monitor.total_errors == 1
+
+
+def test_performance_summary_percentiles_are_weighted():
+    """Test p95/p99 follow per-key query counts."""
+    monitor = DatabaseMonitor()
+
+    for _ in range(90):
+        monitor._update_stats("SELECT", "files", 0.01, "success")
+    for _ in range(10):
+        monitor._update_stats("UPDATE", "files", 0.5, "success")
+
+    summary = monitor.get_performance_summary()
+    assert summary["p95_duration_ms"] == pytest.approx(500.0)
+    assert summary["p99_duration_ms"] == pytest.approx(500.0)
+    assert summary["avg_duration_ms"] == pytest.approx(59.0)
+
+
+def test_performance_summary_skips_percentiles_for_few_samples():
+    """Test p95/p99 are omitted until enough queries are recorded."""
+    monitor = DatabaseMonitor()
+
+    for _ in range(3):
+        monitor._update_stats("SELECT", "files", 0.01, "success")
+
+    summary = monitor.get_performance_summary()
+    assert summary["p95_duration_ms"] is None
+    assert summary["p99_duration_ms"] is None
+    assert summary["avg_duration_ms"] == pytest.approx(10.0)
+
+
 @pytest.mark.asyncio
 async def test_query_optimizer_initialization(test_db_session: AsyncSession):
     """Test query optimizer initialization."""
@@ -76,6 +122,17 @@ async def test_slow_query_detection():
     assert slow_queries[0]["duration"] == 0.15
 
 
+def test_slow_query_log_is_bounded():
+    """Test slow query log keeps only the most recent entries."""
+    monitor = DatabaseMonitor()
+
+    for i in range(MAX_SLOW_QUERIES_LOG + 10):
+        monitor._log_slow_query(f"SELECT {i}", 0.2, "SELECT", "files")
+
+    assert len(monitor.slow_queries) == MAX_SLOW_QUERIES_LOG
+    assert monitor.slow_queries[0]["statement"] == "SELECT 10"
+
+
 @pytest.mark.asyncio
 async def test_query_optimizer_explain_query(test_db_session: AsyncSession):
     """Test query optimizer explain functionality."""
@@ -0,0 +1,118 @@
+"""
+업로드 에러 처리 서비스 테스트
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.orm_models import FileUpload
+from app.services import error_handler_service
+from app.services.error_handler_service import ErrorHandlerService
+from app.utils.logging_config import stop_queue_listeners
+
+
+@pytest.fixture
+def upload_db():
+    """file_uploads 테이블만 만든 SQLite 세션과 실행된 SELECT 목록"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    FileUpload.__table__.create(engine)
+    selects = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record_select(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    session = sessionmaker(bind=engine)()
+    yield session, selects
+    session.close()
+    engine.dispose()
+
+
+def add_upload(session, upload_id, status, started_at):
+    session.add(
+        FileUpload(
+            id=upload_id,
+            file_id=1,
+            upload_status=status,
+            upload_started_at=started_at,
+        )
+    )
+
+
+class TestErrorLogWriter:
+    """ErrorHandlerService 에러 로그 파일 기록 테스트"""
+
+    async def test_queued_line_reaches_log_file(self, tmp_path):
+        service = ErrorHandlerService(db_session=None, base_storage_path=str(tmp_path))
+
+        await service._write_error_log(
+            {
+                "timestamp": "2025-01-01T12:00:00",
+                "error_id": "err-1",
+                "file_uuid": "file-1",
+                "error_type": "storage_error",
+                "upload_ip": "127.0.0.1",
+                "error_message": "디스크 오류",
+            }
+        )
+        stop_queue_listeners(service._get_error_log_writer())
+
+        log_text = (tmp_path / "logs" / "upload_errors.log").read_text(encoding="utf-8")
+        assert "ERROR_ID=err-1" in log_text
+        assert "MESSAGE=디스크 오류" in log_text
+
+    def test_log_path_is_resolved_once(self, tmp_path, monkeypatch):
+        service = ErrorHandlerService(db_session=None, base_storage_path=str(tmp_path))
+        assert service.error_log_file == (tmp_path / "logs" / "upload_errors.log")
+
+        def fail_resolve(*args, **kwargs):
+            raise AssertionError("resolve() called per error")
+
+        monkeypatch.setattr("pathlib.Path.resolve", fail_resolve)
+        writer = service._get_error_log_writer()
+        monkeypatch.undo()
+
+        assert writer is service._get_error_log_writer()
+        stop_queue_listeners(writer)
+
+
+class TestCleanupOldErrorLogs:
+    """ErrorHandlerService.cleanup_old_error_logs 테스트"""
+
+    async def test_only_old_failed_uploads_are_deleted(self, upload_db, tmp_path):
+        session, _ = upload_db
+        old = datetime.now() - timedelta(days=100)
+        recent = datetime.now() - timedelta(days=1)
+        add_upload(session, 1, "failed", old)
+        add_upload(session, 2, "completed", old)
+        add_upload(session, 3, "failed", recent)
+        session.commit()
+
+        service = ErrorHandlerService(session, base_storage_path=str(tmp_path))
+
+        assert await service.cleanup_old_error_logs(days=90) == 1
+        remaining = {upload.id for upload in session.query(FileUpload)}
+        assert remaining == {2, 3}
+
+    async def test_stops_after_short_batch(self, upload_db, tmp_path, monkeypatch):
+        session, selects = upload_db
+        monkeypatch.setattr(error_handler_service, "CLEANUP_BATCH_SIZE", 2)
+        old = datetime.now() - timedelta(days=100)
+        for upload_id in range(1, 6):
+            add_upload(session, upload_id, "failed", old)
+        session.commit()
+        selects.clear()
+
+        service = ErrorHandlerService(session, base_storage_path=str(tmp_path))
+
+        assert await service.cleanup_old_error_logs(days=90) == 5
+        # 2 + 2 + 1건 배치 후 빈 배치를 다시 조회하지 않음
+        assert len(selects) == 3
+        assert session.query(FileUpload).count() == 0
@@ -0,0 +1,94 @@
+"""
+파일 유틸리티 테스트
+"""
+
+import asyncio
+import hashlib
+
+import pytest
+
+from app.utils import file_utils
+from app.utils.file_utils import (
+    calculate_content_hash_async,
+    calculate_file_hash,
+    get_hash_backend_info,
+)
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    path = tmp_path / "sample.bin"
+    path.write_bytes(b"FileWallBall" * 100_000)
+    return path
+
+
+class TestCalculateFileHash:
+    """calculate_file_hash 테스트"""
+
+    @pytest.mark.parametrize("algorithm", ["md5", "sha1", "sha256"])
+    def test_matches_hashlib(self, sample_file, algorithm):
+        expected = hashlib.new(algorithm, sample_file.read_bytes()).hexdigest()
+        assert calculate_file_hash(sample_file, algorithm) == expected
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty"
+        path.write_bytes(b"")
+        assert calculate_file_hash(path, "sha256") == hashlib.sha256().hexdigest()
+
+    def test_modified_file_is_rehashed(self, sample_file):
+        before = calculate_file_hash(sample_file, "sha256")
+        sample_file.write_bytes(b"changed")
+
+        after = calculate_file_hash(sample_file, "sha256")
+
+        assert after != before
+        assert after == hashlib.sha256(b"changed").hexdigest()
+
+
+def test_hash_backend_info():
+    info = get_hash_backend_info()
+    assert info["openssl_version"]
+    assert "sha256" in info["algorithms"]
+    assert info["sha_extensions"] in (True, False, None)
+
+
+class TestAsyncHashing:
+    """비동기 해시 함수 테스트"""
+
+    async def test_content_hash_async_matches_sync(self):
+        content = b"x" * (file_utils.HASH_OFFLOAD_THRESHOLD + 1)
+        assert await calculate_content_hash_async(content) == (
+            hashlib.sha256(content).hexdigest()
+        )
+
+    async def test_small_content_is_hashed_inline(self, monkeypatch):
+        async def fail(*args, **kwargs):
+            raise AssertionError("small content must not be offloaded")
+
+        monkeypatch.setattr(file_utils.asyncio, "to_thread", fail)
+        assert await calculate_content_hash_async(b"abc", "md5") == (
+            hashlib.md5(b"abc").hexdigest()
+        )
+
+    async def test_offloaded_hashes_are_bounded(self, monkeypatch):
+        running = 0
+        peak = 0
+
+        async def fake_to_thread(func, *args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return func(*args)
+
+        monkeypatch.setattr(file_utils, "HASH_MAX_CONCURRENCY", 2)
+        monkeypatch.setattr(file_utils.asyncio, "to_thread", fake_to_thread)
+        content = b"x" * file_utils.HASH_OFFLOAD_THRESHOLD
+
+        digests = await asyncio.gather(
+            *(calculate_content_hash_async(content) for _ in range(6))
+        )
+
+        assert len(set(digests)) == 1
+        assert peak == 2
@@ -0,0 +1,111 @@
+"""
+IP Rate Limit 카운터 테스트
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Update, create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.orm_models import IPRateLimit
+from app.services.ip_auth_service import IPAuthService
+
+WINDOW_START = datetime(2025, 1, 1, 12, 0, 0)
+NOW = datetime(2025, 1, 1, 12, 30, 0)
+
+
+@pytest.fixture(params=[True, False], ids=["returning", "no_returning"])
+def service(request):
+    """
+    IPRateLimit 테이블만 만든 SQLite 세션의 IPAuthService
+
+    no_returning은 UPDATE ... RETURNING을 지원하지 않는 MySQL 경로를 사용합니다.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    IPRateLimit.__table__.create(engine)
+    engine.dialect.update_returning = request.param
+
+    session = sessionmaker(bind=engine)()
+    yield IPAuthService(session)
+    session.close()
+    engine.dispose()
+
+
+def stored_count(service):
+    return service.db.query(IPRateLimit.request_count).scalar()
+
+
+def increment(service):
+    return service._increment_request_count("10.0.0.1", "hash", WINDOW_START, NOW)
+
+
+class TestIncrementRequestCount:
+    """IPAuthService._increment_request_count 테스트"""
+
+    def test_first_hit_creates_window(self, service):
+        assert increment(service) == 1
+        service.db.commit()
+
+        assert service.db.query(IPRateLimit).count() == 1
+        assert stored_count(service) == 1
+
+    def test_existing_window_is_incremented(self, service):
+        increment(service)
+        service.db.commit()
+
+        assert increment(service) == 2
+        assert increment(service) == 3
+        service.db.commit()
+
+        assert service.db.query(IPRateLimit).count() == 1
+        assert stored_count(service) == 3
+
+    def test_other_window_is_counted_separately(self, service):
+        increment(service)
+        other = service._increment_request_count(
+            "10.0.0.1", "hash", datetime(2025, 1, 1, 13, 0, 0), NOW
+        )
+
+        assert other == 1
+        assert service.db.query(IPRateLimit).count() == 2
+
+    def test_integrity_error_retries_as_increment(self, service):
+        # 다른 요청이 같은 시간대 행을 먼저 만든 상황
+        service.db.add(
+            IPRateLimit(
+                ip_address="10.0.0.1",
+                api_key_hash="hash",
+                window_start=WINDOW_START,
+                request_count=4,
+                last_request_at=NOW,
+            )
+        )
+        service.db.commit()
+
+        # 첫 UPDATE가 행을 보지 못한 것처럼 만들어 INSERT가 충돌하게 함
+        real_execute = service.db.execute
+        missed = MagicMock(rowcount=0)
+        missed.scalar.return_value = None
+        calls = []
+
+        def execute(statement, *args, **kwargs):
+            calls.append(statement)
+            if len(calls) == 1:
+                return missed
+            return real_execute(statement, *args, **kwargs)
+
+        service.db.execute = execute
+
+        assert increment(service) == 5
+        service.db.commit()
+
+        # INSERT 충돌 후 UPDATE를 한 번 더 실행
+        assert sum(isinstance(statement, Update) for statement in calls) == 2
+
+        assert service.db.query(IPRateLimit).count() == 1
+        assert stored_count(service) == 5
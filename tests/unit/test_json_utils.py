@@ -0,0 +1,58 @@
+"""
+JSON 유틸리티 테스트
+"""
+
+from datetime import datetime
+
+from app.utils import json_utils
+from app.utils.json_utils import dumps, loads
+
+
+def test_dumps_keeps_non_ascii_characters():
+    encoded = dumps({"filename": "테스트.txt"})
+    assert "테스트.txt" in encoded
+    assert "\\u" not in encoded
+
+
+def test_round_trip():
+    data = {"action": "delete", "count": 3, "tags": ["a", "b"], "nested": {"ok": True}}
+    assert loads(dumps(data)) == data
+
+
+def test_loads_accepts_bytes():
+    assert loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_dumps_falls_back_to_str_for_unknown_types():
+    class Custom:
+        def __str__(self):
+            return "custom"
+
+    assert loads(dumps({"value": Custom()})) == {"value": "custom"}
+
+
+def test_dumps_accepts_datetime():
+    assert "2025-01-01" in dumps({"at": datetime(2025, 1, 1, 12, 0, 0)})
+
+
+def test_dumps_accepts_ints_beyond_64_bits():
+    assert loads(dumps({"size": 2**70})) == {"size": 2**70}
+
+
+class TestStdlibFallback:
+    """orjson이 없을 때도 같은 형식으로 직렬화되는지 테스트"""
+
+    def test_fallback_matches_orjson_format(self, monkeypatch):
+        data = {"a": 1, "name": "테스트", "t": datetime(2025, 1, 1, 12, 0, 0)}
+        expected = '{"a":1,"name":"테스트","t":"2025-01-01T12:00:00"}'
+
+        assert dumps(data) == expected
+        monkeypatch.setattr(json_utils, "orjson", None)
+        assert dumps(data) == expected
+
+    def test_fallback_round_trip(self, monkeypatch):
+        monkeypatch.setattr(json_utils, "orjson", None)
+        data = {"action": "delete", "count": 3, "nested": {"ok": True}}
+
+        assert loads(dumps(data)) == data
+        assert loads(b'{"a": 1}') == {"a": 1}
@@ -0,0 +1,41 @@
+"""
+보안 유틸리티 테스트
+"""
+
+from types import SimpleNamespace
+
+from app.utils.security_utils import get_client_ip
+
+
+def make_request(headers=None, client_host=None):
+    """get_client_ip가 사용하는 속성만 가진 요청 객체"""
+    client = SimpleNamespace(host=client_host) if client_host else None
+    return SimpleNamespace(
+        headers=headers or {}, client=client, state=SimpleNamespace()
+    )
+
+
+class TestGetClientIp:
+    """get_client_ip 테스트"""
+
+    def test_uses_first_forwarded_for_address(self):
+        request = make_request({"x-forwarded-for": "10.0.0.1, 10.0.0.2"}, "1.1.1.1")
+        assert get_client_ip(request) == "10.0.0.1"
+
+    def test_uses_real_ip_header(self):
+        request = make_request({"x-real-ip": "10.0.0.3"}, "1.1.1.1")
+        assert get_client_ip(request) == "10.0.0.3"
+
+    def test_falls_back_to_client_host(self):
+        assert get_client_ip(make_request(client_host="1.1.1.1")) == "1.1.1.1"
+
+    def test_missing_client_is_unknown(self):
+        assert get_client_ip(make_request()) == "unknown"
+
+    def test_result_is_cached_on_request_state(self):
+        request = make_request(client_host="1.1.1.1")
+
+        assert get_client_ip(request) == "1.1.1.1"
+        request.client = None
+        assert get_client_ip(request) == "1.1.1.1"
+        assert request.state.client_ip == "1.1.1.1"